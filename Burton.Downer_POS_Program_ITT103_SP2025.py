@@ -1,19 +1,26 @@
-import uuid #used to generate order ID on sales receipt
 from datetime import datetime #generate current date on sales receipt
 import time #used to delay program exit for 3 seconds
+import sys #used for receipt output, checkout option input and string interning
 from collections import defaultdict #used to group products by category in inventory
+import itertools #used to generate order ID sequence on sales receipt
+import hashlib #used to hash user passwords
+import hmac #used to compare password hashes in constant time
+
+#product categories, interned so every product shares the same string objects
+CATEGORIES = tuple(sys.intern(c) for c in ("General", "Groceries", "Household", "Electronics"))
+GENERAL, GROCERIES, HOUSEHOLD, ELECTRONICS = CATEGORIES
 
 #\\USER & PRODUCT CLASSES
 #product class to handle product ID, name, price, stock and category
 #product ID is unique to each product
 #user class to handle username, password and role
 class Product:
-    def __init__(self, product_id, name, price, stock, category='General, Groceries, Household, Electronics'):
+    def __init__(self, product_id, name, price, stock, category=GENERAL):
         self.id = product_id
         self.name = name
         self.price = price
         self.stock = stock
-        self.category = category
+        self.category = sys.intern(category)
 
     def __str__(self):
         return f"{self.id}. {self.name}   ${self.price:.2f} || Stock: {self.stock} | Category: {self.category}"
@@ -28,29 +35,36 @@ class Product:
         }
 
 class User:
+    #roles each role is allowed to act as, admin users can also perform cashier actions
+    _ROLE_PERMS = {
+        'admin': frozenset({'admin', 'cashier'}),
+        'cashier': frozenset({'cashier'})
+    }
+
     def __init__(self, username, password, role="cashier"):
         self.username = username
-        self.password = password
+        self.password = User.hash_password(password) #only the password hash is stored
         self.role = role
+        self._permissions = User._ROLE_PERMS.get(role, frozenset({role}))
+
+    @staticmethod
+    def hash_password(password): #function to hash a plaintext password to a fixed 16-byte digest
+        return hashlib.blake2b(password.encode(), digest_size=16).digest()
+
+    def check_password(self, password): #function to check entered password against stored hash
+        return hmac.compare_digest(self.password, User.hash_password(password))
 
     def has_permission(self, required_role): #function to check if user has permission to perform certain actions
-        return self.role == required_role
+        return required_role in self._permissions
 
     def to_dict(self): #function to convert user object to dictionary for JSON serialization
         return {
-            'username': self.user,
-            'password': self.pwd,
-            'role': self.cashier,
-            'permissions': self.role
+            'username': self.username,
+            'password': self.password.hex(),
+            'role': self.role,
+            'permissions': sorted(self._permissions)
         }
 
-#\\DISCOUNT CLASS
-#handles discount rate for the POS system
-#discount rate is set to 5% for all products once threshold is met
-class Discount:
-    def apply_discount(self, subtotal):
-        return subtotal * 0.05 #5% discount on subtotal
-
 #\\CART & CART ITEM CLASSES
 #handles products added to cart after it is selected
 #ensures that the quantity is a positive integer
@@ -67,13 +81,18 @@ class CartItem:
 
 #manages shopping cart for selected items customer intends to buy
 #ensures that the cart is empty before adding items
+#discount rate is set to 5% on the subtotal once the threshold is met
 class Cart:
-    def __init__(self): #initializes cart with empty list
-        self.items = []
-        self.discount = Discount()
+    DISCOUNT_THRESHOLD = 5000.0 #minimum subtotal required for discount
+    DISCOUNT_RATE = 0.05 #5% discount on subtotal
+
+    def __init__(self): #initializes cart with empty dictionary keyed by product ID
+        self._items_by_id = {} #dict keeps insertion order so receipt lists items in the order added
+        self._subtotal = 0.0 #running subtotal updated as items are added or removed
 
     def clear(self): #clears cart
-        self.items = []
+        self._items_by_id = {}
+        self._subtotal = 0.0
 
     def add_item(self, product, quantity): #adds a product to the cart with a specified quantity
         if not isinstance(quantity, int) or quantity <= 0:
@@ -82,24 +101,26 @@ class Cart:
 
         #check if product already exists in cart
         #if it does, update the quantity and check stock
-        for item in self.items:
-            if item.product.id == product.id:
-                total_quantity = item.quantity + quantity
-                if total_quantity > product.stock: #ensures the selected quantity is not more than the stock available
-                    print(f"Insufficient stock for {product.name}. Only {product.stock - item.quantity} additional can be added.\n")
-                    return False
-                item.quantity += quantity #updates quantity of product in cart
-                self.check_low_stock(item.product)
-                product.stock -= quantity #updates stock of product in inventory
-                self.check_low_stock(product)
-                return True
+        item = self._items_by_id.get(product.id)
+        if item:
+            total_quantity = item.quantity + quantity
+            if total_quantity > product.stock: #ensures the selected quantity is not more than the stock available
+                print(f"Insufficient stock for {product.name}. Only {product.stock - item.quantity} additional can be added.\n")
+                return False
+            item.quantity += quantity #updates quantity of product in cart
+            self._subtotal += product.price * quantity #updates running subtotal
+            self.check_low_stock(item.product)
+            product.stock -= quantity #updates stock of product in inventory
+            self.check_low_stock(product)
+            return True
 
         if quantity > product.stock: #checks if requested quantity is more than stock in inventory
             print(f"Insufficient stock for {product.name}. Only {product.stock} available.\n")
             return False
 
         cart_item = CartItem(product, quantity)
-        self.items.append(cart_item) #appends item to the cart for same item already in cart
+        self._items_by_id[product.id] = cart_item #adds new item to the cart under its product ID
+        self._subtotal += product.price * quantity #updates running subtotal
         product.stock -= quantity #updates stock of product in inventory
         self.check_low_stock(product)
         return True
@@ -111,59 +132,64 @@ class Cart:
     #removes a specified quantity of a product from the cart
     #ensures cart is not empty and that the selected item is present in the cart
     def remove_item(self, product_id, quantity):
-        removed = False
-        for item in list(self.items):
-            if item.product.id == product_id:
-                if quantity > item.quantity: #checks if requested quantity is more than quantity in cart
-                    print(f"\nCannot remove {quantity} units. Only {item.quantity} {item.product.name}(s) in cart.\n")
-                    print("NO CHANGES MADE\n")
-                    return False
-                item.product.stock += quantity #updates stock of product in inventory
-                self.check_low_stock(item.product)
-                item.quantity -= quantity #updates quantity of product in cart
-                if item.quantity == 0:
-                    self.items.remove(item) 
-                print(f"Removed {quantity} x {item.product.name}. Cart quantity now {item.quantity}.\n")
-                print(f"Product stock updated to: {item.product.stock}.\n")
-                self.check_low_stock(item.product)
-                removed = True
-        if not removed:
+        item = self._items_by_id.get(product_id)
+        if not item:
             print("Item not found. No changes made.\n")
             return False
+        if quantity > item.quantity: #checks if requested quantity is more than quantity in cart
+            print(f"\nCannot remove {quantity} units. Only {item.quantity} {item.product.name}(s) in cart.\n")
+            print("NO CHANGES MADE\n")
+            return False
+        item.product.stock += quantity #updates stock of product in inventory
+        self.check_low_stock(item.product)
+        item.quantity -= quantity #updates quantity of product in cart
+        self._subtotal -= item.product.price * quantity #updates running subtotal
+        if item.quantity == 0:
+            del self._items_by_id[product_id]
+            if not self._items_by_id:
+                self._subtotal = 0.0 #resets running subtotal to avoid float drift once cart is empty
+        print(f"Removed {quantity} x {item.product.name}. Cart quantity now {item.quantity}.\n")
+        print(f"Product stock updated to: {item.product.stock}.\n")
+        self.check_low_stock(item.product)
         return True
 
     def get_all_items(self): #returns all items in the cart
-        return [(item.product, item.quantity) for item in self.items]
+        return [(item.product, item.quantity) for item in self._items_by_id.values()]
 
     def is_empty(self): #checks if cart is empty
-        return not self.items
+        return not self._items_by_id
 
-    def calculate_subtotal(self): #calculates subtotal of all items in the cart
-        return sum(item.total_price() for item in self.items)
+    def calculate_subtotal(self): #returns running subtotal of all items in the cart
+        return self._subtotal
 
-    def apply_discount(self, discount): #applies discount rate to the subtotal
-        self.discount = discount
     #calculates discount amount based on subtotal in accordance with the discount rate
     def discount_amount(self, subtotal):
-        return self.discount.apply_discount(subtotal) if subtotal >= 5000 else self.discount == 0
-    
-    #function to display cart items and calculate subtotal, tax, discount & total
-    def display_receipt(self, tax_rate):
-        print()
-        print("------ Current Cart Items ------".center(40))
-        print()
-        for item in self.items: #displays items in cart
-            print(f"{item.quantity} x {item.product.name} @ ${item.product.price:,.2f}   ${item.total_price():,.2f}\n")
-        subtotal = self.calculate_subtotal()
+        return subtotal * Cart.DISCOUNT_RATE if subtotal >= Cart.DISCOUNT_THRESHOLD else 0.0
+
+    #calculates subtotal, tax, discount & total from the running subtotal in one pass
+    def calculate_totals(self, tax_rate):
+        subtotal = self._subtotal
         tax = subtotal * tax_rate
         discount = self.discount_amount(subtotal)
         total = (subtotal + tax) - discount
-
-        print(f"{'Subtotal:':<35} ${subtotal:,.2f}")
-        print(f"{f'Tax ({tax_rate * 100:.0f}%):':<35} ${tax:,.2f}")
+        return subtotal, tax, discount, total
+    
+    #function to display cart items and calculate subtotal, tax, discount & total
+    #lines are collected and written to the screen in one call
+    def display_receipt(self, tax_rate, tax_pct_str=None):
+        if tax_pct_str is None:
+            tax_pct_str = f"Tax ({tax_rate * 100:.0f}%):"
+        lines = ["", "------ Current Cart Items ------".center(40), ""]
+        for item in self._items_by_id.values(): #displays items in cart
+            lines.append(f"{item.quantity} x {item.product.name} @ ${item.product.price:,.2f}   ${item.total_price():,.2f}\n")
+        subtotal, tax, discount, total = self.calculate_totals(tax_rate)
+
+        lines.append(f"{'Subtotal:':<35} ${subtotal:,.2f}")
+        lines.append(f"{tax_pct_str:<35} ${tax:,.2f}")
         if discount > 0:
-                print(f"{f'Discount:':<35}-${discount:,.2f}")
-        print(f"{'Total Payment Due: ':<35} ${total:,.2f}\n")
+            lines.append(f"{'Discount:':<35}-${discount:,.2f}")
+        lines.append(f"{'Total Payment Due: ':<35} ${total:,.2f}\n")
+        sys.stdout.write("\n".join(lines) + "\n")
         return total
 
 #\\MAIN POS SYSTEM
@@ -171,11 +197,14 @@ class Cart:
 #cashier can add or remove items from cart, view cart, checkout and view inventory
 #payment and receipt generation
 class POS:
+    _order_seq = itertools.count(1) #order sequence shared by all receipts in this session
+
     def __init__(self, tax_rate=0.10, store_name="Best Buy Retail Store",
                  store_address="7 Magic Way, Mullah District, Richmond"):
         self.store_name = store_name
         self.store_address = store_address 
         self.tax_rate = tax_rate
+        self.tax_pct_str = f"Tax ({self.tax_rate * 100:.0f}%):" #tax label reused on every receipt
         self.users = self._initialize_users()
         self.current_user = None
         self.inventory = self._initialize_inventory()
@@ -193,39 +222,46 @@ class POS:
     def _initialize_inventory(self): #function to initialize inventory with products, price and stock available
         products = {
 
-            40: Product(40, "Notebook", 500.00, 8, "General"),
-            45: Product(45, "Unmaster Lock Padlock", 400.00, 5, "General"),
-            101: Product(101, "Rice (5lb)", 480.00, 25, "Groceries"),
-            102: Product(102, "Flour (5lb)", 430.00, 28, "Groceries"),
-            103: Product(103, "Bread", 600.00, 30, "Groceries"),
-            104: Product(104, "Milk", 770.00, 15, "Groceries"),
-            105: Product(105, "Eggs (dozen)", 780.00, 20, "Groceries"),
-            106: Product(106, "Sugar (5lb)", 400.00, 25, "Groceries"),
-            107: Product(107, "Pasta", 120.00, 30, "Groceries"),
-            108: Product(108, "Butter", 250.00, 20, "Groceries"),
-            109: Product(109, "Canned Beans (1kg)", 320.00, 10, "Groceries"),
-            110: Product(110, "Honey", 1940.00, 8, "Groceries"),
-            201: Product(201, "Laundry Detergent", 1050.00, 14, "Household"),
-            202: Product(202, "Bleach", 250.00, 16, "Household"),
-            203: Product(203, "Tissue", 160.00, 36, "Household"),
-            204: Product(204, "Olive Oil (1L)", 165.00, 24, "Household"),
-            205: Product(205, "Dishwashing Liquid", 175.00, 16, "Household"),
-            206: Product(206, "Coconut Oil (1L)", 910.00, 8, "Household"),
-            207: Product(207, "Desk Fan", 8500.00, 12, "Household"),
-            208: Product(208, "Frying Pan (med)", 5560.00, 6, "Household"),
-            209: Product(209, "Light Bulb", 700.00, 18, "Household"),
-            210: Product(210, "Fabric Softener", 300.00, 10, "Household"),
-            211: Product(211, "Toothbrush", 630.00, 12, "Household"),
-            212: Product(212, "Broom", 600.00, 15, "Household"),
-            213: Product(213, "Foil Paper", 660.00, 30, "Household"),
-            214: Product(214, "Rum (750ml)", 1700.00, 24, "Household"),
-            215: Product(215, "Baking Powder (500g)", 140.00, 16, "Household"),
-            301: Product(301, "Wireless Mouse", 1550, 11, "Electronics"),
-            302: Product(302, "Bluetooth Buds", 3100.00, 7, "Electronics"),
-            303: Product(303, "Apple iPad Pro", 35000.00, 6, "Electronics"),
-            304: Product(304, "Smart Speaker", 4500.00, 11, "Electronics"),
-            305: Product(305, "USB-C Cable", 2000.00, 20, "Electronics"),
+            40: Product(40, "Notebook", 500.00, 8, GENERAL),
+            45: Product(45, "Unmaster Lock Padlock", 400.00, 5, GENERAL),
+            101: Product(101, "Rice (5lb)", 480.00, 25, GROCERIES),
+            102: Product(102, "Flour (5lb)", 430.00, 28, GROCERIES),
+            103: Product(103, "Bread", 600.00, 30, GROCERIES),
+            104: Product(104, "Milk", 770.00, 15, GROCERIES),
+            105: Product(105, "Eggs (dozen)", 780.00, 20, GROCERIES),
+            106: Product(106, "Sugar (5lb)", 400.00, 25, GROCERIES),
+            107: Product(107, "Pasta", 120.00, 30, GROCERIES),
+            108: Product(108, "Butter", 250.00, 20, GROCERIES),
+            109: Product(109, "Canned Beans (1kg)", 320.00, 10, GROCERIES),
+            110: Product(110, "Honey", 1940.00, 8, GROCERIES),
+            201: Product(201, "Laundry Detergent", 1050.00, 14, HOUSEHOLD),
+            202: Product(202, "Bleach", 250.00, 16, HOUSEHOLD),
+            203: Product(203, "Tissue", 160.00, 36, HOUSEHOLD),
+            204: Product(204, "Olive Oil (1L)", 165.00, 24, HOUSEHOLD),
+            205: Product(205, "Dishwashing Liquid", 175.00, 16, HOUSEHOLD),
+            206: Product(206, "Coconut Oil (1L)", 910.00, 8, HOUSEHOLD),
+            207: Product(207, "Desk Fan", 8500.00, 12, HOUSEHOLD),
+            208: Product(208, "Frying Pan (med)", 5560.00, 6, HOUSEHOLD),
+            209: Product(209, "Light Bulb", 700.00, 18, HOUSEHOLD),
+            210: Product(210, "Fabric Softener", 300.00, 10, HOUSEHOLD),
+            211: Product(211, "Toothbrush", 630.00, 12, HOUSEHOLD),
+            212: Product(212, "Broom", 600.00, 15, HOUSEHOLD),
+            213: Product(213, "Foil Paper", 660.00, 30, HOUSEHOLD),
+            214: Product(214, "Rum (750ml)", 1700.00, 24, HOUSEHOLD),
+            215: Product(215, "Baking Powder (500g)", 140.00, 16, HOUSEHOLD),
+            301: Product(301, "Wireless Mouse", 1550, 11, ELECTRONICS),
+            302: Product(302, "Bluetooth Buds", 3100.00, 7, ELECTRONICS),
+            303: Product(303, "Apple iPad Pro", 35000.00, 6, ELECTRONICS),
+            304: Product(304, "Smart Speaker", 4500.00, 11, ELECTRONICS),
+            305: Product(305, "USB-C Cable", 2000.00, 20, ELECTRONICS),
         }
+        #pre-lowered name and category for each product so searches skip per-query lowercasing
+        self._search_corpus = [(p.name.lower(), p.category.lower(), p) for p in products.values()]
+        #group products by first digit of ID once, sorted by category for display
+        grouped = defaultdict(list)
+        for p in products.values():
+            grouped[str(p.id)[0]].append(p)
+        self._inventory_by_category = dict(sorted(grouped.items()))
         return products
 
     #\\USER AUTHENTICATION
@@ -239,7 +275,7 @@ class POS:
             password = input("Password: ").strip()
             
             user = self.users.get(username) #fetch user from the dictionary
-            if user and user.password == password:
+            if user and user.check_password(password):
                 self.current_user = user
                 print(f"\nWelcome, {user.username}!")
                 return True
@@ -259,7 +295,7 @@ class POS:
             password = input("Admin Password: ").strip()
         
             user = self.users.get(username) #fetch user from the dictionary
-            if user and user.password == password and (user.has_permission('admin')):
+            if user and user.check_password(password) and (user.has_permission('admin')):
                 self.current_user = user
                 print(f"\nAdmin {user.username} logged in.")
                 return True
@@ -270,23 +306,14 @@ class POS:
 
     #\\PRODUCT SEARCH
     def search_products(self, query): #search for products in the inventory by name or category
-        results = []
         query = query.lower() #convert query to lowercase for case-insensitive search
-        for product in self.inventory.values():
-            if (query in product.name.lower()) or (query in product.category.lower()):
-                results.append(product)
-        return results
+        return [product for name, category, product in self._search_corpus
+                if (query in name) or (query in category)]
 
     #\\CORE POS
     def show_inventory(self): #function to display inventory
         print("\n       === Current Inventory ===")
-        #group products by first digit of ID
-        categories = defaultdict(list)
-        for product in self.inventory.values():
-            category = str(product.id)[0]
-            categories[category].append(product)
-        
-        for category, products in sorted(categories.items()):
+        for category, products in self._inventory_by_category.items():
             print(f"\nCategory {category} Items:")
             for product in products:
                 print(f"  {product}")
@@ -404,10 +431,6 @@ class POS:
                     time.sleep(2)
                     self.new_sale()
                 else:
-                    subtotal = self.cart.calculate_subtotal()
-                    tax = subtotal * self.tax_rate
-                    discount = self.cart.discount_amount(subtotal)
-                    total = (subtotal + tax) - discount
                     subtotal, tax, discount, total = self.recalculate_total()
                     print(f"Updated Cart Total: ${total:,.2f}")
                     time.sleep(1.5)
@@ -421,21 +444,64 @@ class POS:
         if self.cart.is_empty():
             print("Cart is empty.\n")
         else:
-            self.cart.display_receipt(self.tax_rate)
+            self.cart.display_receipt(self.tax_rate, self.tax_pct_str)
     
     def cancel_sale(self): #function to cancel transaction & handle restocking
-        for item in self.cart.items:
+        for item in self.cart._items_by_id.values():
             item.product.stock += item.quantity #restock item
         self.cart.clear() #clear cart
         print("Transaction cancelled. Inventory restored.")
         time.sleep(2) #time delay before main menu is displayed again
     
     def recalculate_total(self): #recalculate totals after item removal during checkout
-        subtotal = self.cart.calculate_subtotal()
-        tax = subtotal * self.tax_rate
-        discount = self.cart.discount_amount(subtotal)
-        total = (subtotal + tax) - discount
-        return subtotal, tax, discount, total
+        return self.cart.calculate_totals(self.tax_rate)
+
+    #\\CHECKOUT OPTIONS
+    #handlers for the options offered when payment is insufficient
+    #each handler returns None to show the options again, RETRY_PAYMENT to
+    #return to payment entry, or True/False to end checkout with that result
+    RETRY_PAYMENT = 'retry'
+    CHECKOUT_PROMPT = "[1] Add more funds [2] Remove items [3] Cancel checkout > "
+
+    def _checkout_add_funds(self): #continue to payment entry
+        return POS.RETRY_PAYMENT
+
+    def _checkout_remove_items(self): #remove items, switching to admin if required
+        if not self.current_user.has_permission('admin'):
+            print("\nAdmin privileges required to remove items during checkout.")
+            print("Please call a supervisor or add more funds.")
+            if input("\nSwitch to admin? (yes/no): ").lower() in ['yes', 'y']:
+                original_user = self.current_user
+                if self.admin_login():
+                    removed = self.remove_item_fr_cart()
+                    self.current_user = original_user
+                    if removed:
+                        return POS.RETRY_PAYMENT #continue to payment entry
+                return None #if admin login or removal fails return to options to choose again
+            #if user chooses not to switch to admin return to options without changes
+            print("Returning to payment options...\n")
+            return None
+        if self.remove_item_fr_cart(): #if user has admin privileges and item removal is successful
+            return POS.RETRY_PAYMENT #continue to payment entry
+        print("No items removed. Returning to payment entry...\n")
+        return False
+
+    def _checkout_cancel(self): #cancel checkout & confirm
+        if input("\nConfirm transaction cancellation (yes/no): ").lower() in ['yes', 'y']:
+            self.cancel_sale() #cancel transaction
+            return True
+        print("\nCheckout cancellation aborted.")
+        return False
+
+    def _checkout_invalid(self): #handle invalid input for choice
+        print("\nInvalid choice. Please try again.")
+        return False
+
+    CHECKOUT_OPTS = {
+        '1': _checkout_add_funds,
+        '2': _checkout_remove_items,
+        '3': _checkout_cancel
+    }
 
     #\\CHECKOUT
     #function to handle checkout process
@@ -450,14 +516,11 @@ class POS:
         #payment summary is provided giving cashier prelim calculations
         while True:
             self.view_cart()
-            subtotal = self.cart.calculate_subtotal()
-            tax = subtotal * self.tax_rate
-            discount = self.cart.discount_amount(subtotal)
-            total = (subtotal + tax) - discount
+            subtotal, tax, discount, total = self.recalculate_total()
 
             print("====== Payment Summary ======".center(40))
             print(f"{'Subtotal:':<35} ${subtotal:,.2f}")
-            print(f"{f'Tax ({self.tax_rate*100:.0f}%):':<35} ${tax:,.2f}")
+            print(f"{self.tax_pct_str:<35} ${tax:,.2f}")
             if discount > 0:
                 print(f"{f'Discount:':<35}-${discount:,.2f}")
             print(f"{'TOTAL DUE:':<35} ${total:,.2f}")
@@ -469,44 +532,15 @@ class POS:
                     print(f"\nInsufficient payment. You need ${shortfall:,.2f} more.\n")
                     #prompt cashier for options to add more funds, remove items or cancel checkout
                     while True:
-                        choice = input("Would you like to:\n1. Add more funds\n2. Remove items\n3. Cancel checkout\n\nEnter option here: ")
-                    
-                        if choice == '1':
-                            break #continue to payment entry
-                        elif choice == '2':
-                            removed = False
-                            if not self.current_user.has_permission('admin'):
-                                print("\nAdmin privileges required to remove items during checkout.")
-                                print("Please call a supervisor or add more funds.")
-                                if input("\nSwitch to admin? (yes/no): ").lower() in ['yes', 'y']:
-                                    original_user = self.current_user
-                                    if self.admin_login():
-                                        removed = self.remove_item_fr_cart()
-                                        self.current_user = original_user
-                                        if removed:
-                                            break #continue to payment entry
-                                    else: #if admin login fails return to options to choose again
-                                        continue
-                                else: #if user chooses not to switch to admin return to payment entry without changes
-                                    print("Returning to payment options...\n")
-                                    continue
-                            else: #if user has admin privileges
-                                removed = self.remove_item_fr_cart()
-                                if removed: #if item removal is successful
-                                    break #continue to payment entry
-                                else: #if item removal fails
-                                    print("No items removed. Returning to payment entry...\n")
-                                    return False
-                        elif choice == '3': #cancel checkout & confirm
-                            if input("\nConfirm transaction cancellation (yes/no): ").lower() in ['yes', 'y']:
-                                self.cancel_sale() #cancel transaction
-                                return True
-                            else: #if user chooses not to cancel transaction
-                                print("\nCheckout cancellation aborted.")
-                                return False
-                        else: #handle invalid input for choice
-                            print("\nInvalid choice. Please try again.")
-                            return False
+                        sys.stdout.write(POS.CHECKOUT_PROMPT)
+                        sys.stdout.flush()
+                        choice = sys.stdin.readline().strip()
+                        result = POS.CHECKOUT_OPTS.get(choice, POS._checkout_invalid)(self)
+                        if result is None: #show options again
+                            continue
+                        if result == POS.RETRY_PAYMENT: #continue to payment entry
+                            break
+                        return result
                 else: #process payment if amount is sufficient
                     change = payment - total #calculate change
                     self.print_receipt(subtotal, tax, discount, total, payment, change)
@@ -519,35 +553,38 @@ class POS:
     #receipt includes order ID, date, cashier name, purchased items, amount paid, subtotal, 
     #tax, discount, total due and change
     def print_receipt(self, subtotal, tax, discount, total, payment, change):
-        #generate unique order ID using current date and time
-        order_id = datetime.now().strftime("%Y%m%d%H%M%S") + "_" + uuid.uuid4().hex[:5]
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M :%S") #fetch current date and time
+        #generate unique order ID using current date and time plus order sequence number
+        now = datetime.now() #fetch current date and time
+        order_id = f"{now.strftime('%Y%m%d%H%M%S')}_{next(POS._order_seq):05d}"
+        timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
         cashier = self.current_user.username #fetch cashier username who processed the order
 
-        print("\n" + "=" * 45) #receipt header
-        print(f"{self.store_name.center(40)}")
-        print(f"{self.store_address.center(40)}")
-        print(f"{self.telephone.center(40)}")
-        print("=" * 45)
-        print(f"Order ID: {order_id}")
-        print(f"Date: {timestamp}")
-        print(f"{'\nCashier:':<10}{cashier}")
-        print("\n" + "-" * 45)
-        
-        for item in self.cart.items: #display purchased items
-            print(f"{item.quantity} @ ${item.product.price:,.2f} {item.product.name.ljust(20)} ${item.total_price():<7,.2f}")
-        
-        print("\n" + "-" * 45) #receipt footer
-        print(f"Subtotal: ${subtotal:,.2f}")
-        print(f"Tax ({self.tax_rate * 100:.0f}%): ${tax:,.2f}")
+        lines = [
+            "\n" + "=" * 45, #receipt header
+            self.store_name.center(40),
+            self.store_address.center(40),
+            self.telephone.center(40),
+            "=" * 45,
+            f"Order ID: {order_id}",
+            f"Date: {timestamp}",
+            f"\n{'Cashier:':<9}{cashier}",
+            "\n" + "-" * 45,
+        ]
+        for item in self.cart._items_by_id.values(): #display purchased items
+            lines.append(f"{item.quantity} @ ${item.product.price:,.2f} {item.product.name.ljust(20)} ${item.total_price():<7,.2f}")
+
+        lines.append("\n" + "-" * 45) #receipt footer
+        lines.append(f"Subtotal: ${subtotal:,.2f}")
+        lines.append(f"{self.tax_pct_str} ${tax:,.2f}")
         if discount > 0:
-            print(f"Discount: -${discount:,.2f}")
-        print(f"Amount Paid: ${payment:,.2f}")
-        print(f"Change: ${change:,.2f}\n")
-        print(f"\nTOTAL DUE: ${total:,.2f}")
-        print("\n" + "=" * 45) #receipt footer
-        print("Thank you for shopping with us!".center(40))
-        print("=" * 45 + "\n")
+            lines.append(f"Discount: -${discount:,.2f}")
+        lines.append(f"Amount Paid: ${payment:,.2f}")
+        lines.append(f"Change: ${change:,.2f}\n")
+        lines.append(f"\nTOTAL DUE: ${total:,.2f}")
+        lines.append("\n" + "=" * 45) #receipt footer
+        lines.append("Thank you for shopping with us!".center(40))
+        lines.append("=" * 45 + "\n")
+        sys.stdout.write("\n".join(lines) + "\n")
         self.cart.clear()
         time.sleep(2) #time delay before input prompt is displayed again
         return True